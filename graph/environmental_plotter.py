@@ -7,45 +7,75 @@ Downloads data from FTP server and creates time series plots
 import sys
 import logging
 import traceback
+import functools
+import importlib.util
 from datetime import datetime as dt
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QGridLayout, QLabel, QLineEdit, 
                              QPushButton, QComboBox, QProgressBar, QMessageBox,
                              QFileDialog, QGroupBox, QStatusBar)
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, QStringListModel, QThreadPool, QTimer, pyqtSignal
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib.ticker import ScalarFormatter
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 import ftplib
 import io
 import os
+import queue
 import re
-from typing import List, Optional
+import threading
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+# Optional JIT compiler for the heat index of long series; only looked up here, it is imported
+# on first use so launching does not pay for it
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+# Optional Parquet engine for the on-disk cache of downloaded files, caching is disabled without it
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
 
 # Configure logging
 def setup_logging():
     """Setup comprehensive logging for the application"""
     
-    # Create formatter
+    # Create formatter (no funcName/lineno, those need a stack walk for every record)
     formatter = logging.Formatter(
-        '%(asctime)s | %(levelname)-8s | %(name)-20s | %(funcName)-20s | Line:%(lineno)-4d | %(message)s'
+        '%(asctime)s | %(levelname)-8s | %(name)-20s | %(message)s'
     )
     
+    # Skip collecting caller, thread and process details that the format does not use
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    
+    # Log level from ROUTINETIMER_LOGLEVEL (e.g. DEBUG), INFO by default
+    level_name = os.environ.get('ROUTINETIMER_LOGLEVEL', 'INFO').upper()
+    level = getattr(logging, level_name, None)
+    if not isinstance(level, int):
+        level = logging.INFO
+    
     # Console handler only
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.DEBUG)
+    console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
     
     # Root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
+    root_logger.setLevel(level)
     root_logger.addHandler(console_handler)
     
     # Create application logger
     logger = logging.getLogger('EnvironmentalPlotter')
-    logger.info("Logging initialized - Console output only")
+    logger.info(f"Logging initialized - Console output only, level {logging.getLevelName(level)}")
     logger.info(f"Application started at {dt.now()}")
     
     return logger
@@ -53,10 +83,169 @@ def setup_logging():
 # Initialize logging
 logger = setup_logging()
 
+# Data file names: DD_MM_YYYY.csv (indoor) or DD_MM_YYYY_outside.csv (outdoor)
+_CSV_DATE_RE = re.compile(r'^(\d{2})_(\d{2})_(\d{4})(_outside)?\.csv$')
+
+# Data file columns: "DD/MM/YYYY HH:MM,sample_size,temperature,pressure[,humidity]"
+_CSV_COLUMNS = ['datetime', 'sample_size', 'temperature', 'pressure', 'humidity']
+
+# Parsed data files are cached here between sessions, one subdirectory per server/directory
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'routinetimer')
+
+
+def _parse_datetimes(column: pd.Series) -> pd.Series:
+    """Convert 'DD/MM/YYYY HH:MM' strings to datetime64, invalid values become NaT"""
+    text = column.astype(str).str.strip()
+    
+    # The logger always writes the fixed-width form, so decode the digits by position
+    # instead of running strptime per row; anything else goes through pd.to_datetime
+    codes = text.to_numpy(dtype='U16').view(np.uint32).reshape(-1, 16).astype(np.int64)
+    digits = codes - ord('0')
+    digit_positions = [0, 1, 3, 4, 6, 7, 8, 9, 11, 12, 14, 15]
+    valid = ((text.str.len().to_numpy() == 16)
+             & (codes[:, 2] == ord('/')) & (codes[:, 5] == ord('/'))
+             & (codes[:, 10] == ord(' ')) & (codes[:, 13] == ord(':'))
+             & ((digits[:, digit_positions] >= 0) & (digits[:, digit_positions] <= 9)).all(axis=1))
+    
+    day = digits[:, 0] * 10 + digits[:, 1]
+    month = digits[:, 3] * 10 + digits[:, 4]
+    year = digits[:, 6] * 1000 + digits[:, 7] * 100 + digits[:, 8] * 10 + digits[:, 9]
+    minutes = (digits[:, 11] * 10 + digits[:, 12]) * 60 + digits[:, 14] * 10 + digits[:, 15]
+    valid &= (month >= 1) & (month <= 12) & (day >= 1) & (minutes < 24 * 60) & (digits[:, 14] <= 5)
+    
+    month_start = np.datetime64('1970-01', 'M') + np.where(valid, (year - 1970) * 12 + month - 1, 0).astype('timedelta64[M]')
+    month_start_day = month_start.astype('datetime64[D]')
+    days_in_month = ((month_start + np.timedelta64(1, 'M')).astype('datetime64[D]') - month_start_day).astype(np.int64)
+    valid &= day <= days_in_month
+    
+    stamps = (month_start_day + (day - 1).astype('timedelta64[D]')).astype('datetime64[m]') + minutes.astype('timedelta64[m]')
+    result = pd.Series(np.where(valid, stamps, np.datetime64('NaT')).astype('datetime64[ns]'), index=column.index)
+    if not valid.all():
+        result[~valid] = pd.to_datetime(text[~valid], format='%d/%m/%Y %H:%M', errors='coerce')
+    return result
+
+
+def _format_datetimes(column: pd.Series) -> pd.Series:
+    """Format datetime64 values as 'DD/MM/YYYY HH:MM' strings"""
+    # Digits are written by position into a fixed-width code-point array, the inverse of
+    # _parse_datetimes and far cheaper than a strftime call per row
+    minute_values = column.to_numpy(dtype='datetime64[m]')
+    days = minute_values.astype('datetime64[D]')
+    months = days.astype('datetime64[M]')
+    years = months.astype('datetime64[Y]')
+    day = (days - months).astype(np.int64) + 1
+    month = (months - years).astype(np.int64) + 1
+    year = years.astype(np.int64) + 1970
+    hour, minute = np.divmod((minute_values - days).astype(np.int64), 60)
+    
+    zero = ord('0')
+    codes = np.empty((len(minute_values), 16), dtype=np.uint32)
+    codes[:, 0], codes[:, 1] = day // 10 + zero, day % 10 + zero
+    codes[:, 3], codes[:, 4] = month // 10 + zero, month % 10 + zero
+    codes[:, 6], codes[:, 7] = year // 1000 + zero, year // 100 % 10 + zero
+    codes[:, 8], codes[:, 9] = year // 10 % 10 + zero, year % 10 + zero
+    codes[:, 11], codes[:, 12] = hour // 10 + zero, hour % 10 + zero
+    codes[:, 14], codes[:, 15] = minute // 10 + zero, minute % 10 + zero
+    codes[:, [2, 5]] = ord('/')
+    codes[:, 10] = ord(' ')
+    codes[:, 13] = ord(':')
+    return pd.Series(codes.view('U16').ravel(), index=column.index)
+
+
+def parse_csv_content(buffer: io.BytesIO) -> pd.DataFrame:
+    """Parse raw CSV bytes from a data file into a pandas DataFrame"""
+    try:
+        # Skip header if present
+        has_header = buffer.getbuffer()[:11].tobytes() == b'Date,Sample'
+        
+        # Outdoor files have "N/A" humidity (or only 4 columns), both become NaN; extra
+        # trailing fields are ignored rather than dropping the line
+        # Only the timestamp column is typed up front; numeric dtypes would make read_csv raise
+        # on a single stray header or truncated line, so numbers are coerced per column below
+        df = pd.read_csv(buffer, header=None, names=_CSV_COLUMNS, usecols=range(len(_CSV_COLUMNS)),
+                         dtype={'datetime': str}, skiprows=1 if has_header else 0, engine='c',
+                         encoding='utf-8', encoding_errors='replace', skipinitialspace=True,
+                         on_bad_lines='skip')
+        
+        # Malformed lines (stray headers, truncated writes) fail conversion and are dropped
+        for column in _CSV_COLUMNS[1:]:
+            df[column] = pd.to_numeric(df[column], errors='coerce')
+        df['datetime'] = _parse_datetimes(df['datetime'])
+        
+        valid = df[_CSV_COLUMNS[:4]].notna().all(axis=1)
+        if not valid.all():
+            logger.warning(f"Skipped {int((~valid).sum())} malformed lines in CSV content")
+            df = df[valid].reset_index(drop=True)
+        
+        if df.empty:
+            logger.warning("No valid data parsed from CSV")
+            return pd.DataFrame()
+        
+        df['sample_size'] = df['sample_size'].astype('int64')
+        return df
+        
+    except Exception as e:
+        logger.error(f"Error parsing CSV content: {e}")
+        logger.debug(f"Full traceback: {traceback.format_exc()}")
+        return pd.DataFrame()
+
+
+def _parse_csv_bytes(raw: bytes) -> pd.DataFrame:
+    """parse_csv_content for raw bytes, the picklable entry point for parser processes"""
+    return parse_csv_content(io.BytesIO(raw))
+
+
+def _heat_index_loop(temp_c, humidity, out):
+    """Single-pass heat index loop, same branches as calculate_heat_index; compiled by numba"""
+    for i in range(temp_c.shape[0]):
+        R = humidity[i]
+        T = (temp_c[i] * 9/5) + 32
+        
+        # Heat index is only meaningful for temps > 80°F (26.7°C) with known humidity
+        if T < 80.0 or np.isnan(R):
+            out[i] = temp_c[i]
+            continue
+        
+        # Basic Heat Index calculation (Rothfusz equation)
+        HI = (-42.379 + 2.04901523*T + 10.14333127*R - 0.22475541*T*R
+              - 6.83783e-3*T*T - 5.481717e-2*R*R + 1.22874e-3*T*T*R
+              + 8.5282e-4*T*R*R - 1.99e-6*T*T*R*R)
+        
+        # Adjustments for extreme conditions
+        if R < 13 and T <= 112:
+            HI = HI - ((13-R)/4) * np.sqrt((17-abs(T-95))/17)
+        elif R > 85 and T <= 87:
+            HI = HI + ((R-85)/10) * ((87-T)/5)
+        
+        out[i] = (HI - 32) * 5/9
+
+
+@functools.lru_cache(maxsize=None)
+def _heat_index_kernel():
+    """Compile _heat_index_loop with numba on first use, None if numba cannot be loaded"""
+    try:
+        from numba import njit
+    except Exception as e:
+        logger.warning(f"numba could not be loaded, using the NumPy heat index: {e}")
+        return None
+    # fastmath without the 'nnan' flag, the NaN-humidity check must survive
+    return njit(fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'}, cache=True)(_heat_index_loop)
+
+
+def _parse_ftp_time(value: Optional[str]) -> Optional[float]:
+    """Convert an FTP time value (YYYYMMDDHHMMSS[.sss], UTC) to a timestamp"""
+    try:
+        return datetime.strptime(value[:14], '%Y%m%d%H%M%S').replace(tzinfo=timezone.utc).timestamp()
+    except (TypeError, ValueError):
+        return None
+
 
 class FTPDataManager:
     """Handles FTP connection and data download"""
     
+    # Read size per RETR callback; ftplib's 8 KiB default means one Python call per 8 KiB
+    RETR_BLOCKSIZE = 256 * 1024
+    
     def __init__(self):
         self.logger = logging.getLogger('FTPDataManager')
         self.logger.debug("FTPDataManager initialized")
@@ -65,6 +254,8 @@ class FTPDataManager:
         self.password = ""
         self.directory = ""
         self.connection = None
+        self.modified_times = {}  # filename -> UTC timestamp, from the MLSD listing
+        self.file_sizes = {}  # filename -> size in bytes, from the listing
     
     def connect(self, host: str, username: str, password: str, directory: str = "") -> bool:
         """Connect to FTP server"""
@@ -140,8 +331,8 @@ class FTPDataManager:
         else:
             self.logger.debug("No active FTP connection to disconnect")
     
-    def list_csv_files(self) -> List[str]:
-        """List all CSV files on the FTP server"""
+    def list_csv_files(self) -> List[Tuple[str, str, bool]]:
+        """List all dated CSV files on the FTP server as (filename, date_str, is_outdoor)"""
         self.logger.info("Starting to list CSV files on FTP server")
         
         if not self.connection:
@@ -149,29 +340,23 @@ class FTPDataManager:
             return []
         
         try:
-            self.logger.debug("Executing LIST command on FTP server")
-            file_list = []
-            self.connection.retrlines('LIST', file_list.append)
-            self.logger.debug(f"Received {len(file_list)} file entries from server")
-            
             csv_files = []
-            for i, line in enumerate(file_list):
-                self.logger.debug(f"Processing file entry {i+1}: {line}")
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+            self.modified_times = {}
+            self.file_sizes = {}
+            for name, modify, size in self._list_file_entries():
+                match = _CSV_DATE_RE.match(name)
                 
-                # Parse FTP LIST output (format may vary by server)
-                parts = line.split()
-                if len(parts) >= 9 and parts[-1].endswith('.csv'):
-                    filename = parts[-1]
-                    self.logger.debug(f"Found CSV file: {filename}")
-                    
-                    # Look for date pattern DD_MM_YYYY.csv or DD_MM_YYYY_outside.csv
-                    if re.match(r'\d{2}_\d{2}_\d{4}\.csv', filename) or re.match(r'\d{2}_\d{2}_\d{4}_outside\.csv', filename):
-                        csv_files.append(filename)
-                        self.logger.debug(f"CSV file matches date pattern: {filename}")
-                    else:
-                        self.logger.debug(f"CSV file does not match date pattern: {filename}")
-                else:
-                    self.logger.debug(f"File entry ignored (not CSV or invalid format): {line}")
+                # Look for date pattern DD_MM_YYYY.csv or DD_MM_YYYY_outside.csv
+                if match:
+                    day, month, year, outside = match.groups()
+                    csv_files.append((name, f"{day}/{month}/{year}", bool(outside)))
+                    if modify is not None:
+                        self.modified_times[name] = modify
+                    if size is not None:
+                        self.file_sizes[name] = size
+                elif debug_enabled:
+                    self.logger.debug("File entry ignored (not a dated CSV file): %s", name)
             
             sorted_files = sorted(csv_files)
             self.logger.info(f"Found {len(sorted_files)} valid CSV files with date pattern")
@@ -190,8 +375,58 @@ class FTPDataManager:
             self.logger.debug(f"Full traceback: {traceback.format_exc()}")
             return []
     
-    def download_file(self, filename: str) -> Optional[str]:
-        """Download a file and return its content as string"""
+    def _list_file_entries(self) -> List[Tuple[str, Optional[float], Optional[int]]]:
+        """List regular files as (name, modified timestamp, size), via MLSD with a LIST fallback"""
+        try:
+            self.logger.debug("Executing MLSD command on FTP server")
+            entries = [(name, _parse_ftp_time(facts.get('modify')),
+                        int(facts['size']) if facts.get('size', '').isdigit() else None)
+                       for name, facts in self.connection.mlsd(facts=['type', 'modify', 'size'])
+                       if facts.get('type', 'file') == 'file']
+            self.logger.debug(f"Received {len(entries)} file entries from server")
+            return entries
+        except ftplib.error_perm as e:
+            # 500/502: MLSD not supported by this server
+            self.logger.info(f"MLSD not available ({e}), falling back to LIST")
+        
+        self.logger.debug("Executing LIST command on FTP server")
+        file_list = []
+        self.connection.retrlines('LIST', file_list.append)
+        self.logger.debug(f"Received {len(file_list)} file entries from server")
+        
+        # Parse FTP LIST output (format may vary by server), the name is the last column and
+        # the size the fifth in the common Unix format
+        return [(parts[-1], None, int(parts[4]) if parts[4].isdigit() else None)
+                for parts in (line.split() for line in file_list) if len(parts) >= 9]
+    
+    def get_modified_time(self, filename: str) -> Optional[float]:
+        """Return the server modification time of a file as a UTC timestamp (listing or MDTM)"""
+        if filename in self.modified_times:
+            return self.modified_times[filename]
+        
+        if not self.connection:
+            return None
+        
+        try:
+            response = self.connection.sendcmd(f'MDTM {filename}')
+            # Response: "213 YYYYMMDDHHMMSS[.sss]"
+            return _parse_ftp_time(response.split()[1])
+        except (ftplib.error_perm, ftplib.error_temp, IndexError) as e:
+            self.logger.debug(f"Could not get modification time of {filename}: {e}")
+            return None
+    
+    def download_file(self, filename: str) -> Optional[pd.DataFrame]:
+        """Download a file and return its parsed content as DataFrame"""
+        file_content = self.download_bytes(filename)
+        if file_content is None:
+            return None
+        
+        df = parse_csv_content(file_content)
+        self.logger.info(f"Successfully downloaded {filename}: {file_content.getbuffer().nbytes} bytes, {df.shape[0]} records")
+        return df
+    
+    def download_bytes(self, filename: str) -> Optional[io.BytesIO]:
+        """Download a file into a memory buffer positioned at its start"""
         self.logger.info(f"Starting download of file: {filename}")
         
         if not self.connection:
@@ -203,19 +438,13 @@ class FTPDataManager:
             file_content = io.BytesIO()
             
             self.logger.debug(f"Executing RETR command for: {filename}")
-            self.connection.retrbinary(f'RETR {filename}', file_content.write)
+            self.connection.retrbinary(f'RETR {filename}', file_content.write, blocksize=self.RETR_BLOCKSIZE)
             
             file_size = file_content.tell()
             self.logger.debug(f"Downloaded {file_size} bytes from {filename}")
             
-            self.logger.debug(f"Decoding content from {filename} as UTF-8")
-            content = file_content.getvalue().decode('utf-8')
-            
-            lines_count = len(content.split('\n'))
-            self.logger.info(f"Successfully downloaded {filename}: {file_size} bytes, {lines_count} lines")
-            self.logger.debug(f"First 100 characters of {filename}: {content[:100]}")
-            
-            return content
+            file_content.seek(0)
+            return file_content
             
         except ftplib.error_perm as e:
             self.logger.error(f"Permission error downloading {filename}: {e}")
@@ -223,56 +452,308 @@ class FTPDataManager:
         except ftplib.error_temp as e:
             self.logger.error(f"Temporary error downloading {filename}: {e}")
             return None
-        except UnicodeDecodeError as e:
-            self.logger.error(f"UTF-8 decode error for {filename}: {e}")
-            return None
         except Exception as e:
             self.logger.error(f"Unexpected error downloading {filename}: {e}")
             self.logger.debug(f"Full traceback: {traceback.format_exc()}")
             return None
 
 
-class FTPDownloadThread(QThread):
-    """Thread for downloading FTP data without blocking UI"""
+# Sized for several years of indoor and outdoor day files, so the download that follows
+# the startup load is served from memory; cleared once downloaded data replaces it so
+# stale versions and other directories' frames are not kept alive
+@functools.lru_cache(maxsize=4096)
+def _read_cached_parquet(path: str, mtime: float) -> pd.DataFrame:
+    """Read a cached data file; keyed on mtime so a rewritten cache file is read again"""
+    return pd.read_parquet(path)
+
+
+class DataFileCache:
+    """On-disk Parquet cache of parsed data files, validated against the server modification time"""
+    
+    def __init__(self, host: str, directory: str):
+        self.logger = logging.getLogger('DataFileCache')
+        # Normalised here so the startup load and the download worker always agree on the directory
+        host, directory = host.strip(), directory.strip()
+        self.cache_dir = os.path.join(CACHE_DIR, re.sub(r'[^\w.-]+', '_', f"{host}_{directory}").strip('_'))
+        self.logger.debug(f"DataFileCache initialized in {self.cache_dir}")
+    
+    def _cache_path(self, filename: str) -> str:
+        return os.path.join(self.cache_dir, os.path.splitext(filename)[0] + '.parquet')
+    
+    def load(self, filename: str, server_mtime: float) -> Optional[pd.DataFrame]:
+        """Return the cached DataFrame for filename, or None if it is missing or out of date"""
+        path = self._cache_path(filename)
+        try:
+            local_mtime = os.path.getmtime(path)
+        except OSError:
+            return None
+        
+        # Cache files are stamped with the server mtime they were downloaded at
+        if local_mtime < server_mtime:
+            self.logger.debug("Cached copy of %s is out of date", filename)
+            return None
+        
+        try:
+            return _read_cached_parquet(path, local_mtime)
+        except Exception as e:
+            self.logger.warning(f"Could not read cached copy of {filename}: {e}")
+            return None
+    
+    def store(self, filename: str, df: pd.DataFrame, server_mtime: float):
+        """Write a parsed DataFrame to the cache, stamped with the server modification time"""
+        path = self._cache_path(filename)
+        temp_path = f"{path}.tmp{threading.get_ident()}"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            df.to_parquet(temp_path, compression='zstd', index=False)
+            os.utime(temp_path, (server_mtime, server_mtime))
+            os.replace(temp_path, path)
+            self.logger.debug("Cached %s at %s", filename, path)
+        except Exception as e:
+            self.logger.warning(f"Could not cache {filename}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    
+    def load_all(self) -> Dict[str, pd.DataFrame]:
+        """Return every cached DataFrame keyed by its CSV filename, without checking the server"""
+        cached = {}
+        try:
+            entries = sorted(os.listdir(self.cache_dir))
+        except OSError:
+            return cached
+        
+        for entry in entries:
+            if not entry.endswith('.parquet'):
+                continue
+            path = os.path.join(self.cache_dir, entry)
+            try:
+                cached[entry[:-len('.parquet')] + '.csv'] = _read_cached_parquet(path, os.path.getmtime(path))
+            except Exception as e:
+                self.logger.warning(f"Could not read cached file {entry}: {e}")
+        
+        self.logger.debug("Loaded %d files from %s", len(cached), self.cache_dir)
+        return cached
+
+
+class FTPDownloadSignals(QObject):
+    """Signals of FTPDownloadWorker, delivered to the GUI thread through queued connections"""
     
     progress_updated = pyqtSignal(int)
     status_updated = pyqtSignal(str)
     download_complete = pyqtSignal(dict, dict, list)
     download_error = pyqtSignal(str)
+
+
+class FTPDownloadWorker(QRunnable):
+    """Pool task for downloading FTP data without blocking UI"""
+    
+    # Number of concurrent FTP sessions used for downloading
+    DOWNLOAD_WORKERS = 8
+    
+    # Files at least this large are parsed in a separate process; below it the process
+    # start-up and pickling cost more than parsing on the download thread
+    PROCESS_PARSE_MIN_BYTES = 8 * 1024 * 1024
+    
+    # Minimum seconds between progress and status updates, so many small files do not flood the GUI thread
+    PROGRESS_INTERVAL = 1 / 30
     
     def __init__(self, host, username, password, directory):
         super().__init__()
-        self.logger = logging.getLogger('FTPDownloadThread')
-        self.logger.debug("FTPDownloadThread initialized")
+        self.logger = logging.getLogger('FTPDownloadWorker')
+        self.logger.debug("FTPDownloadWorker initialized")
+        
+        # QRunnable is not a QObject, its signals live on a holder created in the GUI thread
+        self.signals = FTPDownloadSignals()
         
         self.host = host
         self.username = username
         self.password = password
         self.directory = directory
         
+        # Files unchanged on the server since the last session are loaded from disk
+        self.cache = DataFileCache(host, directory) if PARQUET_AVAILABLE else None
+        if self.cache is None:
+            self.logger.info("pyarrow not installed, local file cache disabled")
+        
         self.logger.debug(f"Thread configured - Host: {host}, Username: {username}, Directory: '{directory}'")
     
+    def download_files(self, ftp_manager: FTPDataManager, csv_files: List[str]) -> Dict[str, Optional[pd.DataFrame]]:
+        """Download files concurrently, one FTP session per worker sharing a work queue"""
+        results = {}
+        self._results_lock = threading.Lock()
+        self._last_progress_emit = 0.0
+        self._last_status_emit = 0.0
+        self._modified_times = ftp_manager.modified_times
+        self._file_sizes = ftp_manager.file_sizes
+        
+        # Files that are current in the local cache are loaded before any further session is
+        # opened, so the download sessions are only sized for the files actually fetched
+        to_fetch = []
+        if self.cache is not None:
+            self.signals.status_updated.emit("Checking local cache...")
+        for filename in csv_files:
+            df = self._load_cached(ftp_manager, filename)
+            if df is not None:
+                results[filename] = df
+            else:
+                to_fetch.append(filename)
+        self._completed = len(results)
+        if results:
+            self.logger.info(f"Loaded {len(results)} current files from local cache")
+        
+        if not to_fetch:
+            return results
+        
+        num_workers = min(self.DOWNLOAD_WORKERS, len(to_fetch))
+        self.logger.info(f"Downloading {len(to_fetch)} files using {num_workers} parallel FTP sessions")
+        
+        work_queue = queue.Queue()
+        for filename in to_fetch:
+            work_queue.put(filename)
+        
+        # Parser processes are only started when the listing reports large files
+        large_files = [f for f in to_fetch if self._file_sizes.get(f, 0) >= self.PROCESS_PARSE_MIN_BYTES]
+        self._parse_pool = None
+        if large_files:
+            num_processes = min(os.cpu_count() or 1, len(large_files))
+            self.logger.info(f"Parsing {len(large_files)} large files in {num_processes} processes")
+            # spawn rather than fork, this process is running Qt and several threads
+            self._parse_pool = ProcessPoolExecutor(max_workers=num_processes,
+                                                   mp_context=multiprocessing.get_context('spawn'))
+        
+        try:
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                # The already-connected listing session is worker 0 and keeps draining the
+                # queue even if the server refuses the additional sessions
+                futures = [executor.submit(self._download_worker, work_queue, results, len(csv_files), ftp_manager)]
+                futures += [executor.submit(self._download_worker, work_queue, results, len(csv_files))
+                            for _ in range(num_workers - 1)]
+                for future in futures:
+                    future.result()
+        finally:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown()
+                self._parse_pool = None
+        
+        return results
+    
+    def _download_worker(self, work_queue: queue.Queue, results: Dict[str, Optional[pd.DataFrame]], total: int,
+                         ftp_manager: Optional[FTPDataManager] = None):
+        """Pull filenames off the work queue and download them over a single FTP session"""
+        owns_connection = ftp_manager is None
+        if owns_connection:
+            ftp_manager = FTPDataManager()
+            if not ftp_manager.connect(self.host, self.username, self.password, self.directory):
+                self.logger.warning("Additional FTP session could not connect, leaving files to other workers")
+                return
+            # Reuse the modification times from the listing instead of an MDTM per file
+            ftp_manager.modified_times = self._modified_times
+            ftp_manager.file_sizes = self._file_sizes
+        
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        try:
+            while True:
+                try:
+                    filename = work_queue.get_nowait()
+                except queue.Empty:
+                    break
+                
+                with self._results_lock:
+                    now = time.monotonic()
+                    emit_status = now - self._last_status_emit > self.PROGRESS_INTERVAL
+                    if emit_status:
+                        self._last_status_emit = now
+                if emit_status:
+                    self.signals.status_updated.emit(f"Downloading {filename}...")
+                df = self._fetch_file(ftp_manager, filename)
+                
+                with self._results_lock:
+                    results[filename] = df
+                    self._completed += 1
+                    completed = self._completed
+                    progress = int((completed / total) * 100)
+                    now = time.monotonic()
+                    emit_progress = progress == 100 or now - self._last_progress_emit > self.PROGRESS_INTERVAL
+                    if emit_progress:
+                        self._last_progress_emit = now
+                
+                if debug_enabled:
+                    self.logger.debug("Download progress: %d%% (%d/%d)", progress, completed, total)
+                if emit_progress:
+                    self.signals.progress_updated.emit(progress)
+        finally:
+            if owns_connection:
+                ftp_manager.disconnect()
+    
+    def _download_file(self, ftp_manager: FTPDataManager, filename: str) -> Optional[pd.DataFrame]:
+        """Download and parse a file, handing large files to the parser processes"""
+        if self._parse_pool is None or ftp_manager.file_sizes.get(filename, 0) < self.PROCESS_PARSE_MIN_BYTES:
+            return ftp_manager.download_file(filename)
+        
+        file_content = ftp_manager.download_bytes(filename)
+        if file_content is None:
+            return None
+        
+        # This download thread waits while the other sessions keep downloading
+        try:
+            df = self._parse_pool.submit(_parse_csv_bytes, file_content.getvalue()).result()
+        except Exception as e:
+            self.logger.warning(f"Parser process failed for {filename} ({e}), parsing in this thread")
+            df = parse_csv_content(file_content)
+        self.logger.info(f"Successfully downloaded {filename}: {file_content.getbuffer().nbytes} bytes, {df.shape[0]} records")
+        return df
+    
+    def _load_cached(self, ftp_manager: FTPDataManager, filename: str) -> Optional[pd.DataFrame]:
+        """Return a file from the local cache if it is current, None if it has to be downloaded"""
+        if self.cache is None:
+            return None
+        
+        server_mtime = ftp_manager.get_modified_time(filename)
+        if server_mtime is None:
+            return None
+        # Remembered for the download sessions, so an MDTM is not sent twice for this file
+        ftp_manager.modified_times[filename] = server_mtime
+        
+        df = self.cache.load(filename, server_mtime)
+        if df is not None:
+            self.logger.debug("Loaded %s from local cache (%d records)", filename, len(df))
+        return df
+    
+    def _fetch_file(self, ftp_manager: FTPDataManager, filename: str) -> Optional[pd.DataFrame]:
+        """Download a file and store it in the local cache"""
+        if self.cache is None:
+            return self._download_file(ftp_manager, filename)
+        
+        # Taken before the RETR, so a file appended to during the download is fetched again
+        server_mtime = ftp_manager.get_modified_time(filename)
+        df = self._download_file(ftp_manager, filename)
+        if df is not None and not df.empty and server_mtime is not None:
+            self.cache.store(filename, df, server_mtime)
+        return df
+    
     def run(self):
-        """Run the download process in a separate thread"""
-        self.logger.info("Starting FTP download thread")
+        """Run the download process on a thread pool thread"""
+        self.logger.info("Starting FTP download worker")
         ftp_manager = FTPDataManager()
         
         try:
             self.logger.debug("Emitting connection status update")
-            self.status_updated.emit("Connecting to FTP server...")
+            self.signals.status_updated.emit("Connecting to FTP server...")
             
-            self.logger.info("Initiating FTP connection from thread")
+            self.logger.info("Initiating FTP connection from worker")
             # Connect to FTP
             success = ftp_manager.connect(self.host, self.username, self.password, self.directory)
             
             if not success:
                 error_msg = "Failed to connect to FTP server"
                 self.logger.error(error_msg)
-                self.download_error.emit(error_msg)
+                self.signals.download_error.emit(error_msg)
                 return
             
             self.logger.info("FTP connection successful, proceeding to file listing")
-            self.status_updated.emit("Listing CSV files...")
+            self.signals.status_updated.emit("Listing CSV files...")
             
             # Get list of CSV files
             csv_files = ftp_manager.list_csv_files()
@@ -281,55 +762,38 @@ class FTPDownloadThread(QThread):
             if not csv_files:
                 error_msg = "No CSV files found on the server"
                 self.logger.warning(error_msg)
-                self.download_error.emit(error_msg)
+                self.signals.download_error.emit(error_msg)
                 return
             
             self.logger.info(f"Found {len(csv_files)} CSV files to download")
-            self.status_updated.emit(f"Found {len(csv_files)} files. Downloading...")
+            self.signals.status_updated.emit(f"Found {len(csv_files)} files. Downloading...")
+            
+            # Download all files over parallel FTP sessions
+            downloaded = self.download_files(ftp_manager, [filename for filename, _, _ in csv_files])
             
-            # Download all files
             data_cache = {}
             outdoor_data_cache = {}
             available_dates = []
+            seen_dates = set()
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
             
-            for i, filename in enumerate(csv_files):
-                progress = int((i / len(csv_files)) * 100)
-                self.logger.debug(f"Download progress: {progress}% ({i+1}/{len(csv_files)})")
-                self.progress_updated.emit(progress)
-                self.status_updated.emit(f"Downloading {filename}...")
-                
-                self.logger.info(f"Downloading file {i+1}/{len(csv_files)}: {filename}")
-                content = ftp_manager.download_file(filename)
+            for filename, date_str, is_outdoor in csv_files:
+                df = downloaded.get(filename)
                 
-                if content:
-                    self.logger.debug(f"Successfully downloaded {filename}, processing date")
-                    
-                    # Check if it's an outdoor file
-                    is_outdoor = filename.endswith('_outside.csv')
-                    
-                    # Parse date from filename
+                if df is not None:
                     if is_outdoor:
-                        date_match = re.match(r'(\d{2})_(\d{2})_(\d{4})_outside\.csv', filename)
+                        outdoor_data_cache[date_str] = df
+                        if debug_enabled:
+                            self.logger.debug("Outdoor file %s mapped to date: %s (%d records)", filename, date_str, len(df))
                     else:
-                        date_match = re.match(r'(\d{2})_(\d{2})_(\d{4})\.csv', filename)
+                        data_cache[date_str] = df
+                        if debug_enabled:
+                            self.logger.debug("Indoor file %s mapped to date: %s", filename, date_str)
                     
-                    if date_match:
-                        day, month, year = date_match.groups()
-                        date_str = f"{day}/{month}/{year}"
-                        
-                        if is_outdoor:
-                            outdoor_data_cache[date_str] = content
-                            self.logger.debug(f"Outdoor file {filename} mapped to date: {date_str}")
-                            self.logger.debug(f"Outdoor content preview: {content[:150]}")
-                        else:
-                            data_cache[date_str] = content
-                            self.logger.debug(f"Indoor file {filename} mapped to date: {date_str}")
-                        
-                        # Add to available dates if not already present
-                        if date_str not in available_dates:
-                            available_dates.append(date_str)
-                    else:
-                        self.logger.warning(f"File {filename} does not match expected date pattern")
+                    # Add to available dates if not already present
+                    if date_str not in seen_dates:
+                        seen_dates.add(date_str)
+                        available_dates.append(date_str)
                 else:
                     self.logger.error(f"Failed to download content for {filename}")
             
@@ -338,8 +802,9 @@ class FTPDownloadThread(QThread):
             ftp_manager.disconnect()
             
             self.logger.debug(f"Sorting {len(available_dates)} dates")
-            # Sort dates
-            available_dates.sort(key=lambda x: datetime.strptime(x, "%d/%m/%Y"))
+            # Sort dates, parsed once in a single vectorized call
+            order = pd.to_datetime(available_dates, format="%d/%m/%Y").argsort()
+            available_dates = [available_dates[i] for i in order]
             self.logger.debug(f"Sorted dates: {available_dates}")
             
             # Summary logging
@@ -350,24 +815,80 @@ class FTPDownloadThread(QThread):
             self.logger.debug(f"Outdoor dates: {list(outdoor_data_cache.keys())}")
             
             self.logger.info(f"Download process completed successfully: {len(available_dates)} unique dates")
-            self.progress_updated.emit(100)
-            self.status_updated.emit(f"Successfully downloaded {indoor_count + outdoor_count} files ({indoor_count} indoor, {outdoor_count} outdoor)")
-            self.download_complete.emit(data_cache, outdoor_data_cache, available_dates)
+            self.signals.progress_updated.emit(100)
+            self.signals.status_updated.emit(f"Successfully downloaded {indoor_count + outdoor_count} files ({indoor_count} indoor, {outdoor_count} outdoor)")
+            self.signals.download_complete.emit(data_cache, outdoor_data_cache, available_dates)
             
         except Exception as e:
             error_msg = f"Error during download: {str(e)}"
             self.logger.error(error_msg)
             self.logger.debug(f"Full traceback: {traceback.format_exc()}")
-            self.download_error.emit(error_msg)
+            self.signals.download_error.emit(error_msg)
         finally:
             self.logger.debug("Ensuring FTP connection is closed in finally block")
             ftp_manager.disconnect()
-            self.logger.info("FTP download thread completed")
+            self.logger.info("FTP download worker completed")
+
+
+class CachedDataSignals(QObject):
+    """Signals of CachedDataLoader, delivered to the GUI thread through queued connections"""
+    
+    load_complete = pyqtSignal(dict, dict, list)
+
+
+class CachedDataLoader(QRunnable):
+    """Pool task reading the local file cache of a server directory into per-date DataFrames"""
+    
+    def __init__(self, host, directory):
+        super().__init__()
+        self.logger = logging.getLogger('CachedDataLoader')
+        
+        # QRunnable is not a QObject, its signals live on a holder created in the GUI thread
+        self.signals = CachedDataSignals()
+        self.cache = DataFileCache(host, directory)
+    
+    def run(self):
+        """Load every cached file and emit the data, nothing is emitted for an empty cache"""
+        try:
+            cached = self.cache.load_all()
+            
+            data_cache = {}
+            outdoor_data_cache = {}
+            for filename, df in cached.items():
+                match = _CSV_DATE_RE.match(filename)
+                if not match:
+                    continue
+                day, month, year, outside = match.groups()
+                date_str = f"{day}/{month}/{year}"
+                if outside:
+                    outdoor_data_cache[date_str] = df
+                else:
+                    data_cache[date_str] = df
+            
+            available_dates = list(dict.fromkeys([*data_cache, *outdoor_data_cache]))
+            if not available_dates:
+                self.logger.debug("No cached data files found")
+                return
+            order = pd.to_datetime(available_dates, format="%d/%m/%Y").argsort()
+            available_dates = [available_dates[i] for i in order]
+            
+            self.signals.load_complete.emit(data_cache, outdoor_data_cache, available_dates)
+            
+        except Exception as e:
+            self.logger.error(f"Error loading cached data: {e}")
+            self.logger.debug(f"Full traceback: {traceback.format_exc()}")
 
 
 class MatplotlibCanvas(FigureCanvas):
     """Custom matplotlib canvas for PyQt5"""
     
+    # Longer series are decimated before plotting, more vertices than this are not visible
+    MAX_PLOT_POINTS = 5000
+    
+    # Shorter series use the NumPy heat index; the numba kernel costs ~0.2-0.4 s to load or
+    # compile on first use and only saves tens of ms per call from about a year of minute data
+    NUMBA_MIN_POINTS = 500_000
+    
     def __init__(self, parent=None):
         self.logger = logging.getLogger('MatplotlibCanvas')
         self.logger.debug("Initializing matplotlib canvas")
@@ -383,8 +904,28 @@ class MatplotlibCanvas(FigureCanvas):
         
         # Initialize hover annotation variables
         self.current_df = None
+        self._dt_values = None  # Sorted datetime64[ns] of current_df for hover lookups
+        self._hover_columns = {}  # current_df value columns as plain ndarrays
+        self._hover_key = None  # (axes, index) of the point the annotation currently shows
         self.hover_annotation = None
         
+        # Line2D handles of the time series plots, reused across replots
+        self._lines = {}
+        
+        # Coalesce mouse motion events into at most one hover redraw per ~33 ms (30 Hz)
+        self._pending_event = None
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(33)
+        self._hover_timer.timeout.connect(self._do_hover_draw)
+        
+        # Clean copy of the rendered figure; the hover annotation is animated and blitted on top
+        self._background = None
+        self.mpl_connect('draw_event', self._on_draw)
+        
+        # The layout is only recomputed for the first plot and when the canvas is resized
+        self.mpl_connect('resize_event', self._on_resize)
+        
         # Connect mouse motion event
         self.mpl_connect('motion_notify_event', self.on_hover)
         
@@ -398,6 +939,11 @@ class MatplotlibCanvas(FigureCanvas):
         
         # Clear stored data for hover functionality
         self.current_df = None
+        self._dt_values = None
+        self._hover_columns = {}
+        self._hover_key = None
+        self.hover_annotation = None  # Removed from its axes by ax.clear() below
+        self._lines = {}
         
         try:
             for i, ax in enumerate(self.axes.flat):
@@ -420,16 +966,50 @@ class MatplotlibCanvas(FigureCanvas):
             self.logger.error(f"Error clearing plots: {e}")
             self.logger.debug(f"Full traceback: {traceback.format_exc()}")
     
+    def _on_draw(self, event):
+        """Capture the background after every full redraw (replot, resize) for hover blitting"""
+        self._background = self.copy_from_bbox(self.figure.bbox)
+        if self.hover_annotation is not None and self.hover_annotation.get_visible():
+            self.figure.draw_artist(self.hover_annotation)
+    
+    def _on_resize(self, event):
+        """Fit the subplot layout to the new canvas size"""
+        if self._lines:
+            self.figure.tight_layout()
+    
+    def _blit_hover_annotation(self):
+        """Repaint the hover annotation over the cached background instead of redrawing the figure"""
+        if self._background is None:
+            self.draw_idle()
+            return
+        self.restore_region(self._background)
+        if self.hover_annotation is not None and self.hover_annotation.get_visible():
+            self.figure.draw_artist(self.hover_annotation)
+        # The annotation may extend past its subplot, so the whole figure region is blitted
+        self.blit(self.figure.bbox)
+    
     def on_hover(self, event):
-        """Handle mouse hover events to show data point values"""
+        """Handle mouse hover events; the latest event is drawn when the throttle timer fires"""
+        self._pending_event = event
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
+    
+    def _do_hover_draw(self):
+        """Show the data point values for the most recent pending hover event"""
+        event = self._pending_event
+        self._pending_event = None
+        if event is None:
+            return
+        
         if event.inaxes is None or self.current_df is None or len(self.current_df) == 0:
             # Clear any existing annotations
             if hasattr(self, 'hover_annotation') and self.hover_annotation:
                 self.hover_annotation.set_visible(False)
-                self.draw_idle()
+                self._blit_hover_annotation()
             return
         
         # Clear previous annotation
+        was_visible = self.hover_annotation is not None and self.hover_annotation.get_visible()
         if hasattr(self, 'hover_annotation') and self.hover_annotation:
             self.hover_annotation.set_visible(False)
         
@@ -439,7 +1019,7 @@ class MatplotlibCanvas(FigureCanvas):
         y_pos = event.ydata
         
         if x_pos is None or y_pos is None:
-            self.draw_idle()
+            self._blit_hover_annotation()
             return
         
         # Find the closest data point
@@ -452,58 +1032,82 @@ class MatplotlibCanvas(FigureCanvas):
             if hover_time.tzinfo is not None:
                 hover_time = hover_time.replace(tzinfo=None)
             
-            # Find closest time point in data
-            time_diffs = abs(self.current_df['datetime'] - hover_time)
-            closest_idx = time_diffs.idxmin()
-            closest_point = self.current_df.iloc[closest_idx]
+            # Find closest time point in data by binary search over the sorted timestamps
+            hover_dt64 = np.datetime64(hover_time, 'ns')
+            closest_idx = int(np.searchsorted(self._dt_values, hover_dt64))
+            if closest_idx == len(self._dt_values) or (
+                    closest_idx > 0 and hover_dt64 - self._dt_values[closest_idx - 1] <= self._dt_values[closest_idx] - hover_dt64):
+                closest_idx -= 1
             
             # Check if we're close enough to the point (within reasonable distance)
-            time_tolerance = pd.Timedelta(hours=2)  # 2 hours tolerance
-            if time_diffs.iloc[closest_idx] > time_tolerance:
+            time_tolerance = np.timedelta64(2, 'h')  # 2 hours tolerance
+            if abs(self._dt_values[closest_idx] - hover_dt64) > time_tolerance:
+                self._blit_hover_annotation()
                 return
             
+            # Still nearest to the point already annotated: nothing to format or redraw
+            if (ax, closest_idx) == self._hover_key and self.hover_annotation is not None:
+                self.hover_annotation.set_visible(True)
+                if not was_visible:
+                    self._blit_hover_annotation()
+                return
+            
+            # Plain ndarray indexing, a current_df.iloc row would box every column
+            closest_point = {name: values[closest_idx] for name, values in self._hover_columns.items()}
+            closest_point['datetime'] = pd.Timestamp(self._dt_values[closest_idx])
+            
             # Determine which plot we're hovering over and get appropriate values
             annotation_text = ""
             display_x = closest_point['datetime']
             display_y = 0
+            time_label = display_x.strftime('%d/%m/%Y %H:%M')
             
             if ax == self.axes[0, 0]:  # Temperature plot
                 display_y = closest_point['temperature']
-                annotation_text = f"Time: {display_x.strftime('%d/%m/%Y %H:%M')}\nIndoor Temp: {display_y:.1f}°C"
+                annotation_text = f"Time: {time_label}\nIndoor Temp: {display_y:.1f}°C"
             elif ax == self.axes[0, 1]:  # Humidity plot
                 display_y = closest_point['humidity']
                 # Only show humidity if it's a valid value (not NaN/NA for outdoor data)
                 if pd.isna(display_y):
-                    annotation_text = f"Time: {display_x.strftime('%d/%m/%Y %H:%M')}\nHumidity: N/A"
+                    annotation_text = f"Time: {time_label}\nHumidity: N/A"
                 else:
-                    annotation_text = f"Time: {display_x.strftime('%d/%m/%Y %H:%M')}\nHumidity: {display_y:.1f}%RH"
+                    annotation_text = f"Time: {time_label}\nHumidity: {display_y:.1f}%RH"
             elif ax == self.axes[1, 0]:  # Pressure plot
                 display_y = closest_point['pressure']
-                annotation_text = f"Time: {display_x.strftime('%d/%m/%Y %H:%M')}\nIndoor Pressure: {display_y:.1f}hPa"
+                annotation_text = f"Time: {time_label}\nIndoor Pressure: {display_y:.1f}hPa"
             elif ax == self.axes[1, 1]:  # Feels like temperature plot
                 if 'feels_like' in closest_point:
                     display_y = closest_point['feels_like']
                     actual_temp = closest_point['temperature']
-                    annotation_text = f"Time: {display_x.strftime('%d/%m/%Y %H:%M')}\nFeels Like: {display_y:.1f}°C\nActual: {actual_temp:.1f}°C"
+                    annotation_text = f"Time: {time_label}\nFeels Like: {display_y:.1f}°C\nActual: {actual_temp:.1f}°C"
                 else:
                     display_y = closest_point['temperature']
-                    annotation_text = f"Time: {display_x.strftime('%d/%m/%Y %H:%M')}\nTemp: {display_y:.1f}°C"
+                    annotation_text = f"Time: {time_label}\nTemp: {display_y:.1f}°C"
             
             if annotation_text:
-                # Simple positioning that avoids clipping by using top-left offset
-                # This ensures the annotation is always visible within the plot area
-                self.hover_annotation = ax.annotate(
-                    annotation_text,
-                    xy=(display_x, display_y),
-                    xytext=(-80, 40),  # Position to upper-left of the point
-                    textcoords='offset points',
-                    bbox={'boxstyle': 'round,pad=0.5', 'fc': 'lightyellow', 'alpha': 0.9, 'edgecolor': 'gray'},
-                    arrowprops={'arrowstyle': '->', 'connectionstyle': 'arc3,rad=0', 'color': 'gray'},
-                    fontsize=9,
-                    zorder=1000
-                )
+                # The annotation is created once per axes and then only moved and re-labelled
+                if self.hover_annotation is None or self.hover_annotation.axes is not ax:
+                    if self.hover_annotation is not None:
+                        self.hover_annotation.remove()
+                    # Simple positioning that avoids clipping by using top-left offset
+                    # This ensures the annotation is always visible within the plot area
+                    self.hover_annotation = ax.annotate(
+                        "",
+                        xy=(display_x, display_y),
+                        xytext=(-80, 40),  # Position to upper-left of the point
+                        textcoords='offset points',
+                        bbox={'boxstyle': 'round,pad=0.5', 'fc': 'lightyellow', 'alpha': 0.9, 'edgecolor': 'gray'},
+                        arrowprops={'arrowstyle': '->', 'connectionstyle': 'arc3,rad=0', 'color': 'gray'},
+                        fontsize=9,
+                        zorder=1000,
+                        animated=True
+                    )
+                self.hover_annotation.set_text(annotation_text)
+                self.hover_annotation.xy = (display_x, display_y)
+                self.hover_annotation.set_visible(True)
+                self._hover_key = (ax, closest_idx)
                 
-            self.draw_idle()
+            self._blit_hover_annotation()
             
         except Exception as e:
             self.logger.debug(f"Error in hover handler: {e}")
@@ -543,73 +1147,174 @@ class MatplotlibCanvas(FigureCanvas):
             self.logger.warning(f"Error calculating heat index: {e}")
             return temp_c  # Return original temperature on error
     
+    @staticmethod
+    def calculate_heat_index_vec(temp_c: np.ndarray, humidity: np.ndarray) -> np.ndarray:
+        """Vectorized heat index over whole temperature/humidity arrays (NaN humidity -> actual temp)"""
+        temp_c = np.ascontiguousarray(temp_c, dtype=float)
+        R = np.ascontiguousarray(humidity, dtype=float)
+        
+        kernel = _heat_index_kernel() if NUMBA_AVAILABLE and len(temp_c) >= MatplotlibCanvas.NUMBA_MIN_POINTS else None
+        if kernel is not None:
+            out = np.empty_like(temp_c)
+            kernel(temp_c, R, out)
+            return out
+        
+        # Convert Celsius to Fahrenheit
+        T = (temp_c * 9/5) + 32
+        
+        # Basic Heat Index calculation (Rothfusz equation)
+        HI = (-42.379 + 2.04901523*T + 10.14333127*R - 0.22475541*T*R
+              - 6.83783e-3*T*T - 5.481717e-2*R*R + 1.22874e-3*T*T*R
+              + 8.5282e-4*T*R*R - 1.99e-6*T*T*R*R)
+        
+        # Adjustments for extreme conditions (np.where evaluates both branches, so
+        # silence the sqrt of out-of-range values that the mask discards anyway)
+        m1 = (R < 13) & (T >= 80) & (T <= 112)
+        m2 = ~m1 & (R > 85) & (T >= 80) & (T <= 87)
+        with np.errstate(invalid='ignore'):
+            HI = np.where(m1, HI - ((13-R)/4) * np.sqrt((17-np.abs(T-95))/17), HI)
+        HI = np.where(m2, HI + ((R-85)/10) * ((87-T)/5), HI)
+        
+        # Heat index is only meaningful for temps > 80°F (26.7°C) with known humidity
+        return np.where((T < 80.0) | np.isnan(R), temp_c, (HI - 32) * 5/9)
+    
+    @staticmethod
+    def _downsample(x: np.ndarray, y: np.ndarray, max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Reduce a series to at most max_points by keeping the min and max sample of each bucket"""
+        n = len(y)
+        if n <= max_points:
+            return x, y
+        
+        # Equal-size buckets (the last one padded with NaN), two points kept per bucket so
+        # spikes survive; buckets that are all NaN keep a NaN and the gap in the line
+        buckets = max_points // 2
+        size = -(-n // buckets)
+        padded = np.full(buckets * size, np.nan)
+        padded[:n] = y
+        padded = padded.reshape(buckets, size)
+        base = np.arange(buckets) * size
+        lows = base + np.argmin(np.where(np.isnan(padded), np.inf, padded), axis=1)
+        highs = base + np.argmax(np.where(np.isnan(padded), -np.inf, padded), axis=1)
+        
+        keep = np.unique(np.concatenate(([0, n - 1], lows, highs)))
+        keep = keep[keep < n]
+        return x[keep], y[keep]
+    
+    def _update_line(self, key: str, ax, x, y, *args, **kwargs):
+        """Update the stored Line2D for key with new data, plotting it on ax the first time"""
+        # Only the drawn line is decimated, current_df keeps full resolution for hover
+        x, y = self._downsample(x, y, self.MAX_PLOT_POINTS)
+        line = self._lines.get(key)
+        if line is None:
+            line, = ax.plot(x, y, *args, **kwargs)
+            self._lines[key] = line
+        else:
+            line.set_data(x, y)
+        return line
+    
+    def _remove_line(self, key: str):
+        """Remove the stored Line2D for key (e.g. when a range has no outdoor data)"""
+        line = self._lines.pop(key, None)
+        if line is not None:
+            line.remove()
+    
     def create_time_series_plots(self, indoor_df: pd.DataFrame, outdoor_df: pd.DataFrame = None):
         """Create time series plots"""
         self.logger.info(f"Creating time series plots for {len(indoor_df)} indoor data points")
         if outdoor_df is not None and not outdoor_df.empty:
             self.logger.info(f"Also plotting {len(outdoor_df)} outdoor data points")
         
-        # Store DataFrame for hover functionality (using indoor data as primary)
-        self.current_df = indoor_df.copy()
+        # Hover data is stored once the feels like column is available (below)
+        self.current_df = None
+        self._dt_values = None
+        self._hover_columns = {}
+        self._hover_key = None
+        # Replots keep the axes, so the old annotation has to be detached explicitly
+        if self.hover_annotation is not None:
+            self.hover_annotation.remove()
+            self.hover_annotation = None
         
         try:
-            # Clear previous plots
-            self.logger.debug("Clearing previous plots")
-            for ax in self.axes.flat:
-                ax.clear()
-                ax.set_visible(True)
+            # The axes are only rebuilt the first time; later calls update the existing
+            # Line2D artists in place so ticks, labels and formatters are kept
+            first_plot = not self._lines
+            has_outdoor = outdoor_df is not None and not outdoor_df.empty
+            indoor_times = indoor_df['datetime'].to_numpy()
+            outdoor_times = outdoor_df['datetime'].to_numpy() if has_outdoor else None
+            
+            if first_plot:
+                self.logger.debug("Clearing previous plots")
+                for ax in self.axes.flat:
+                    ax.clear()
+                    ax.set_visible(True)
             
             # Plot 1: Temperature (Indoor and Outdoor)
             self.logger.debug("Creating temperature plot")
-            self.axes[0, 0].plot(indoor_df['datetime'], indoor_df['temperature'], 'r-', linewidth=1.5, label='Indoor Temperature')
-            if outdoor_df is not None and not outdoor_df.empty:
-                self.axes[0, 0].plot(outdoor_df['datetime'], outdoor_df['temperature'], 'orange', linewidth=1.5, label='Outdoor Temperature')
-            
-            self.axes[0, 0].set_title('Temperature Over Time')
-            self.axes[0, 0].set_ylabel('Temperature (°C)')
-            self.axes[0, 0].grid(True, alpha=0.3)
-            self.axes[0, 0].tick_params(axis='x', rotation=45)
+            self._update_line('temp_in', self.axes[0, 0], indoor_times, indoor_df['temperature'].to_numpy(),
+                              'r-', linewidth=1.5, label='Indoor Temperature')
+            if has_outdoor:
+                self._update_line('temp_out', self.axes[0, 0], outdoor_times, outdoor_df['temperature'].to_numpy(),
+                                  'orange', linewidth=1.5, label='Outdoor Temperature')
+            else:
+                self._remove_line('temp_out')
+            
+            if first_plot:
+                self.axes[0, 0].set_title('Temperature Over Time')
+                self.axes[0, 0].set_ylabel('Temperature (°C)')
+                self.axes[0, 0].grid(True, alpha=0.3)
+                self.axes[0, 0].tick_params(axis='x', rotation=45)
             self.axes[0, 0].legend()
             
-            temp_range_indoor = f"Indoor: {indoor_df['temperature'].min():.1f}°C to {indoor_df['temperature'].max():.1f}°C"
-            self.logger.debug(f"Temperature range - {temp_range_indoor}")
-            if outdoor_df is not None and not outdoor_df.empty:
-                temp_range_outdoor = f"Outdoor: {outdoor_df['temperature'].min():.1f}°C to {outdoor_df['temperature'].max():.1f}°C"
-                self.logger.debug(f"Temperature range - {temp_range_outdoor}")
+            # Range summaries scan whole columns, only compute them when DEBUG is enabled
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                temp_range_indoor = f"Indoor: {indoor_df['temperature'].min():.1f}°C to {indoor_df['temperature'].max():.1f}°C"
+                self.logger.debug(f"Temperature range - {temp_range_indoor}")
+                if has_outdoor:
+                    temp_range_outdoor = f"Outdoor: {outdoor_df['temperature'].min():.1f}°C to {outdoor_df['temperature'].max():.1f}°C"
+                    self.logger.debug(f"Temperature range - {temp_range_outdoor}")
             
             # Plot 2: Humidity (Indoor only - outdoor sensor doesn't have humidity data)
             self.logger.debug("Creating humidity plot")
-            self.axes[0, 1].plot(indoor_df['datetime'], indoor_df['humidity'], 'b-', linewidth=1.5, label='Indoor Humidity')
-            self.axes[0, 1].set_title('Humidity Over Time (Indoor Only)')
-            self.axes[0, 1].set_ylabel('Humidity (%RH)')
-            self.axes[0, 1].grid(True, alpha=0.3)
-            self.axes[0, 1].tick_params(axis='x', rotation=45)
-            self.axes[0, 1].legend()
-            humidity_range = f"{indoor_df['humidity'].min():.1f}% to {indoor_df['humidity'].max():.1f}%"
-            self.logger.debug(f"Humidity range: {humidity_range}")
+            self._update_line('humidity_in', self.axes[0, 1], indoor_times, indoor_df['humidity'].to_numpy(dtype=float, na_value=np.nan),
+                              'b-', linewidth=1.5, label='Indoor Humidity')
+            if first_plot:
+                self.axes[0, 1].set_title('Humidity Over Time (Indoor Only)')
+                self.axes[0, 1].set_ylabel('Humidity (%RH)')
+                self.axes[0, 1].grid(True, alpha=0.3)
+                self.axes[0, 1].tick_params(axis='x', rotation=45)
+                self.axes[0, 1].legend()
+            if debug_enabled:
+                humidity_range = f"{indoor_df['humidity'].min():.1f}% to {indoor_df['humidity'].max():.1f}%"
+                self.logger.debug(f"Humidity range: {humidity_range}")
             # Note: Outdoor humidity is not plotted as outdoor sensors report "N/A" for humidity
             
             # Plot 3: Pressure (Indoor and Outdoor)
             self.logger.debug("Creating pressure plot")
-            self.axes[1, 0].plot(indoor_df['datetime'], indoor_df['pressure'], 'g-', linewidth=1.5, label='Indoor Pressure')
-            if outdoor_df is not None and not outdoor_df.empty:
+            self._update_line('pressure_in', self.axes[1, 0], indoor_times, indoor_df['pressure'].to_numpy(),
+                              'g-', linewidth=1.5, label='Indoor Pressure')
+            if has_outdoor:
                 # Subtract 1 from outdoor pressure values for calibration
-                self.axes[1, 0].plot(outdoor_df['datetime'], outdoor_df['pressure'] - 1, 'purple', linewidth=1.5, label='Outdoor Pressure')
+                self._update_line('pressure_out', self.axes[1, 0], outdoor_times, outdoor_df['pressure'].to_numpy() - 1,
+                                  'purple', linewidth=1.5, label='Outdoor Pressure')
+            else:
+                self._remove_line('pressure_out')
             
-            self.axes[1, 0].set_title('Atmospheric Pressure Over Time')
-            self.axes[1, 0].set_ylabel('Pressure (hPa)')
-            self.axes[1, 0].grid(True, alpha=0.3)
-            self.axes[1, 0].tick_params(axis='x', rotation=45)
+            if first_plot:
+                self.axes[1, 0].set_title('Atmospheric Pressure Over Time')
+                self.axes[1, 0].set_ylabel('Pressure (hPa)')
+                self.axes[1, 0].grid(True, alpha=0.3)
+                self.axes[1, 0].tick_params(axis='x', rotation=45)
+                
+                # Fix Y-axis formatting to prevent scientific notation
+                pressure_formatter = ScalarFormatter(useOffset=False)
+                pressure_formatter.set_scientific(False)
+                self.axes[1, 0].yaxis.set_major_formatter(pressure_formatter)
             self.axes[1, 0].legend()
             
-            # Fix Y-axis formatting to prevent scientific notation
-            pressure_formatter = ScalarFormatter(useOffset=False)
-            pressure_formatter.set_scientific(False)
-            self.axes[1, 0].yaxis.set_major_formatter(pressure_formatter)
-            
             # Set Y-axis limits to show proper pressure range
             all_pressure_values = indoor_df['pressure'].tolist()
-            if outdoor_df is not None and not outdoor_df.empty:
+            if has_outdoor:
                 all_pressure_values.extend(outdoor_df['pressure'].tolist())
             
             min_pressure = min(all_pressure_values)
@@ -617,47 +1322,63 @@ class MatplotlibCanvas(FigureCanvas):
             pressure_range = max_pressure - min_pressure
             padding = max(pressure_range * 0.05, 1)  # 5% padding or minimum 1 hPa
             
-            self.axes[1, 0].set_ylim(min_pressure - padding, max_pressure + padding)
-            
-            pressure_range_indoor = f"Indoor: {indoor_df['pressure'].min():.1f}hPa to {indoor_df['pressure'].max():.1f}hPa"
-            self.logger.debug(f"Pressure range - {pressure_range_indoor}")
-            if outdoor_df is not None and not outdoor_df.empty:
-                pressure_range_outdoor = f"Outdoor: {outdoor_df['pressure'].min():.1f}hPa to {outdoor_df['pressure'].max():.1f}hPa"
-                self.logger.debug(f"Pressure range - {pressure_range_outdoor}")
+            if debug_enabled:
+                pressure_range_indoor = f"Indoor: {indoor_df['pressure'].min():.1f}hPa to {indoor_df['pressure'].max():.1f}hPa"
+                self.logger.debug(f"Pressure range - {pressure_range_indoor}")
+                if has_outdoor:
+                    pressure_range_outdoor = f"Outdoor: {outdoor_df['pressure'].min():.1f}hPa to {outdoor_df['pressure'].max():.1f}hPa"
+                    self.logger.debug(f"Pressure range - {pressure_range_outdoor}")
             
             # Plot 4: Feels Like Temperature (Heat Index)
             self.logger.debug("Creating feels like temperature plot")
             # Calculate feels like temperature for indoor data
-            feels_like_temp = []
-            for _, row in indoor_df.iterrows():
-                feels_like = self.calculate_heat_index(row['temperature'], row['humidity'])
-                feels_like_temp.append(feels_like)
-            
-            indoor_df_copy = indoor_df.copy()
-            indoor_df_copy['feels_like'] = feels_like_temp
-            
-            self.axes[1, 1].plot(indoor_df_copy['datetime'], indoor_df_copy['feels_like'], 'darkred', linewidth=1.5, marker='o', markersize=1, label='Feels Like')
-            self.axes[1, 1].plot(indoor_df_copy['datetime'], indoor_df_copy['temperature'], 'lightcoral', linewidth=1, alpha=0.7, label='Actual Temp')
-            self.axes[1, 1].set_title('Feels Like Temperature Over Time')
-            self.axes[1, 1].set_ylabel('Temperature (°C)')
-            self.axes[1, 1].set_xlabel('Date/Time')
-            self.axes[1, 1].grid(True, alpha=0.3)
-            self.axes[1, 1].tick_params(axis='x', rotation=45)
-            self.axes[1, 1].legend()
-            
-            feels_like_range = f"{min(feels_like_temp):.1f}°C to {max(feels_like_temp):.1f}°C"
-            self.logger.debug(f"Feels like temperature range: {feels_like_range}")
-            
-            # Update stored data for hover functionality to include feels like temp
+            feels_like_temp = self.calculate_heat_index_vec(
+                indoor_df['temperature'].to_numpy(dtype=float),
+                indoor_df['humidity'].to_numpy(dtype=float, na_value=np.nan)
+            )
+            
+            self._update_line('feels_like', self.axes[1, 1], indoor_times, feels_like_temp,
+                              'darkred', linewidth=1.5, marker='o', markersize=1, label='Feels Like')
+            self._update_line('temp_actual', self.axes[1, 1], indoor_times, indoor_df['temperature'].to_numpy(),
+                              'lightcoral', linewidth=1, alpha=0.7, label='Actual Temp')
+            if first_plot:
+                self.axes[1, 1].set_title('Feels Like Temperature Over Time')
+                self.axes[1, 1].set_ylabel('Temperature (°C)')
+                self.axes[1, 1].set_xlabel('Date/Time')
+                self.axes[1, 1].grid(True, alpha=0.3)
+                self.axes[1, 1].tick_params(axis='x', rotation=45)
+                self.axes[1, 1].legend()
+            
+            if debug_enabled:
+                feels_like_range = f"{feels_like_temp.min():.1f}°C to {feels_like_temp.max():.1f}°C"
+                self.logger.debug(f"Feels like temperature range: {feels_like_range}")
+            
+            # Rescale every axes to the new data; the pressure axes keeps its padded range
+            for ax in self.axes.flat:
+                ax.relim()
+                ax.autoscale_view()
+            self.axes[1, 0].set_ylim(min_pressure - padding, max_pressure + padding)
+            
+            # Store data for hover functionality (using indoor data as primary); a shallow
+            # copy shares the column buffers, only the feels like column is new
+            self.current_df = indoor_df.copy(deep=False)
             self.current_df['feels_like'] = feels_like_temp
+            self._dt_values = indoor_df['datetime'].to_numpy(dtype='datetime64[ns]')
+            self._hover_columns = {
+                name: self.current_df[name].to_numpy(dtype=float, na_value=np.nan)
+                for name in ('temperature', 'humidity', 'pressure', 'feels_like')
+            }
             
             # Format x-axis
             self.logger.debug("Formatting x-axis for all plots")
             for ax in self.axes.flat:
                 ax.tick_params(axis='x', labelsize=8)
             
-            self.figure.tight_layout()
-            self.draw()
+            # tight_layout was most of the replot time and the layout only changes with the
+            # canvas size, so replots keep it
+            if first_plot:
+                self.figure.tight_layout()
+            self.draw_idle()
             
             self.logger.info("Time series plots created and displayed successfully")
             
@@ -679,13 +1400,20 @@ class EnvironmentalDataPlotter(QMainWindow):
         self.setWindowTitle("Environmental Data Plotter")
         self.setGeometry(100, 100, 1200, 800)
         
-        self.data_cache = {}  # Cache downloaded indoor data
-        self.outdoor_data_cache = {}  # Cache downloaded outdoor data
+        self.data_cache = {}  # Cache downloaded indoor data (parsed DataFrames)
+        self.outdoor_data_cache = {}  # Cache downloaded outdoor data (parsed DataFrames)
         self.available_dates = []
+        self._date_keys = np.array([], dtype='datetime64[D]')  # available_dates as sorted datetime64
+        self._combined_cache = {}  # kind -> ((start, end), combined DataFrame, file count) of the last range
         
         self.logger.debug("Setting up user interface")
         self.setup_ui()
         
+        # Show the data of the last session while the window is up, connecting refreshes it
+        self.cache_loader = None
+        self.download_done = False  # Set once downloaded data replaced whatever was loaded
+        self.load_cached_data()
+        
         self.logger.info("Application initialization complete")
     
     def setup_ui(self):
@@ -790,14 +1518,19 @@ class EnvironmentalDataPlotter(QMainWindow):
             self.dates_info_label.setStyleSheet("color: blue;")
             date_layout.addWidget(self.dates_info_label, 0, 1)
             
+            # Both dropdowns show the same list model, replaced in one reset per download
+            self.dates_model = QStringListModel(self)
+            
             # Start date
             date_layout.addWidget(QLabel("Start Date:"), 1, 0)
             self.start_date_combo = QComboBox()
+            self.start_date_combo.setModel(self.dates_model)
             date_layout.addWidget(self.start_date_combo, 1, 1)
             
             # End date
             date_layout.addWidget(QLabel("End Date:"), 1, 2)
             self.end_date_combo = QComboBox()
+            self.end_date_combo.setModel(self.dates_model)
             date_layout.addWidget(self.end_date_combo, 1, 3)
             
             # Plot button
@@ -826,12 +1559,12 @@ class EnvironmentalDataPlotter(QMainWindow):
         
         try:
             plot_group = QGroupBox("Environmental Data Plot")
-            plot_layout = QVBoxLayout(plot_group)
+            self.plot_layout = QVBoxLayout(plot_group)
             
-            # Create matplotlib canvas
-            self.logger.debug("Initializing matplotlib canvas")
-            self.canvas = MatplotlibCanvas()
-            plot_layout.addWidget(self.canvas)
+            # The matplotlib canvas is created once the event loop runs, so the window
+            # is painted without waiting for the figure to be built and drawn
+            self.canvas = None
+            QTimer.singleShot(0, self.create_canvas)
             
             parent_layout.addWidget(plot_group)
             self.logger.debug("Plot area created successfully")
@@ -841,6 +1574,22 @@ class EnvironmentalDataPlotter(QMainWindow):
             self.logger.debug(f"Full traceback: {traceback.format_exc()}")
             raise
     
+    def create_canvas(self):
+        """Create the matplotlib canvas in the plot area"""
+        if self.canvas is not None:
+            return
+        
+        try:
+            self.logger.debug("Initializing matplotlib canvas")
+            self.canvas = MatplotlibCanvas()
+            self.plot_layout.addWidget(self.canvas)
+            self.logger.debug("Matplotlib canvas added to plot area")
+            
+        except Exception as e:
+            self.logger.error(f"Error creating matplotlib canvas: {e}")
+            self.logger.debug(f"Full traceback: {traceback.format_exc()}")
+            raise
+    
     def connect_and_download(self):
         """Connect to FTP and download all CSV files"""
         self.logger.info("Starting FTP connection and download process")
@@ -854,9 +1603,9 @@ class EnvironmentalDataPlotter(QMainWindow):
             self.connect_btn.setEnabled(False)
             self.progress_bar.setValue(0)
             
-            # Start download thread
-            self.logger.debug("Creating and starting FTP download thread")
-            self.download_thread = FTPDownloadThread(
+            # Start download worker
+            self.logger.debug("Creating and starting FTP download worker")
+            self.download_worker = FTPDownloadWorker(
                 server,
                 username,
                 self.password_edit.text(),
@@ -864,15 +1613,15 @@ class EnvironmentalDataPlotter(QMainWindow):
             )
             
             # Connect signals
-            self.logger.debug("Connecting thread signals")
-            self.download_thread.progress_updated.connect(self.progress_bar.setValue)
-            self.download_thread.status_updated.connect(self.status_bar.showMessage)
-            self.download_thread.download_complete.connect(self.on_download_complete)
-            self.download_thread.download_error.connect(self.on_download_error)
+            self.logger.debug("Connecting worker signals")
+            self.download_worker.signals.progress_updated.connect(self.progress_bar.setValue)
+            self.download_worker.signals.status_updated.connect(self.status_bar.showMessage)
+            self.download_worker.signals.download_complete.connect(self.on_download_complete)
+            self.download_worker.signals.download_error.connect(self.on_download_error)
             
             # Start download
-            self.download_thread.start()
-            self.logger.info("FTP download thread started successfully")
+            QThreadPool.globalInstance().start(self.download_worker)
+            self.logger.info("FTP download worker started successfully")
             
         except Exception as e:
             self.logger.error(f"Error starting FTP download: {e}")
@@ -886,12 +1635,9 @@ class EnvironmentalDataPlotter(QMainWindow):
         self.logger.debug(f"Available dates: {available_dates}")
         
         try:
-            self.data_cache = data_cache
-            self.outdoor_data_cache = outdoor_data_cache
-            self.available_dates = available_dates
-            
-            self.logger.debug("Updating date selection dropdowns")
-            self.update_date_selection()
+            _read_cached_parquet.cache_clear()
+            self.set_data(data_cache, outdoor_data_cache, available_dates)
+            self.download_done = True
             self.connect_btn.setEnabled(True)
             
             indoor_count = len(data_cache)
@@ -906,6 +1652,50 @@ class EnvironmentalDataPlotter(QMainWindow):
             self.logger.debug(f"Full traceback: {traceback.format_exc()}")
             QMessageBox.critical(self, "Error", f"Error processing downloaded data: {str(e)}")
     
+    def set_data(self, data_cache, outdoor_data_cache, available_dates):
+        """Replace the loaded data and refresh the date selection"""
+        self.data_cache = data_cache
+        self.outdoor_data_cache = outdoor_data_cache
+        self.available_dates = available_dates
+        self._date_keys = pd.to_datetime(available_dates, format="%d/%m/%Y").to_numpy(dtype='datetime64[D]')
+        self._combined_cache = {}
+        
+        self.logger.debug("Updating date selection dropdowns")
+        self.update_date_selection()
+    
+    def load_cached_data(self):
+        """Start loading the files cached by the last download from the configured server"""
+        # Nothing to do without pyarrow, or when a download already started and replaces the data
+        if not PARQUET_AVAILABLE or not self.connect_btn.isEnabled():
+            return
+        
+        try:
+            # Reading a year of Parquet files takes seconds, so it runs on the thread pool
+            self.cache_loader = CachedDataLoader(self.server_edit.text(), self.directory_edit.text())
+            self.cache_loader.signals.load_complete.connect(self.on_cached_data_loaded)
+            QThreadPool.globalInstance().start(self.cache_loader)
+            self.logger.debug("Cached data loader started")
+            
+        except Exception as e:
+            self.logger.error(f"Error loading cached data: {e}")
+            self.logger.debug(f"Full traceback: {traceback.format_exc()}")
+    
+    def on_cached_data_loaded(self, data_cache, outdoor_data_cache, available_dates):
+        """Show the cached data unless a download has started since, its data is fresher"""
+        if not self.connect_btn.isEnabled() or self.download_done:
+            self.logger.debug("Download started while loading the cache, cached data dropped")
+            return
+        
+        try:
+            self.set_data(data_cache, outdoor_data_cache, available_dates)
+            file_count = len(data_cache) + len(outdoor_data_cache)
+            self.logger.info(f"Loaded {file_count} cached data files ({len(data_cache)} indoor, {len(outdoor_data_cache)} outdoor)")
+            self.status_bar.showMessage(f"Loaded {file_count} cached files, connect to refresh")
+            
+        except Exception as e:
+            self.logger.error(f"Error showing cached data: {e}")
+            self.logger.debug(f"Full traceback: {traceback.format_exc()}")
+    
     def on_download_error(self, error_message):
         """Handle download error"""
         self.logger.error(f"Download failed: {error_message}")
@@ -927,6 +1717,11 @@ class EnvironmentalDataPlotter(QMainWindow):
             self.logger.warning("No available dates to update selection")
             return
         
+        # A refresh that finds the same dates keeps the dropdowns and the current selection
+        if self.available_dates == self.dates_model.stringList():
+            self.logger.debug("Available dates unchanged, date selection kept")
+            return
+        
         try:
             # Update info label
             start_date = self.available_dates[0]
@@ -936,10 +1731,7 @@ class EnvironmentalDataPlotter(QMainWindow):
             
             # Update dropdowns
             self.logger.debug("Populating date dropdowns")
-            self.start_date_combo.clear()
-            self.end_date_combo.clear()
-            self.start_date_combo.addItems(self.available_dates)
-            self.end_date_combo.addItems(self.available_dates)
+            self.dates_model.setStringList(self.available_dates)
             
             # Set default selection
             self.start_date_combo.setCurrentText(start_date)
@@ -955,83 +1747,35 @@ class EnvironmentalDataPlotter(QMainWindow):
             self.logger.error(f"Error updating date selection: {e}")
             self.logger.debug(f"Full traceback: {traceback.format_exc()}")
     
-    def parse_csv_content(self, content: str) -> pd.DataFrame:
-        """Parse CSV content into pandas DataFrame"""
-        self.logger.debug(f"Parsing CSV content ({len(content)} characters)")
+    def _get_combined(self, start_dt: datetime, end_dt: datetime, kind: str) -> Tuple[Optional[pd.DataFrame], int]:
+        """Return the time-sorted 'indoor' or 'outdoor' data of a date range and its file count"""
+        # Only the last range per kind is kept: plot then export of one range hits it, and
+        # earlier ranges do not pile up full copies of the data over a session
+        cached = self._combined_cache.get(kind)
+        if cached is not None and cached[0] == (start_dt, end_dt):
+            return cached[1], cached[2]
         
-        try:
-            lines = content.strip().split('\n')
-            self.logger.debug(f"CSV has {len(lines)} lines")
-            
-            # Skip header if present
-            data_lines = []
-            for line in lines:
-                if line.strip() and not line.startswith('Date,Sample'):
-                    data_lines.append(line.strip())
-            
-            self.logger.debug(f"Found {len(data_lines)} data lines after filtering")
-            
-            if not data_lines:
-                self.logger.warning("No data lines found in CSV content")
-                return pd.DataFrame()
-            
-            # Parse data
-            parsed_data = []
-            for i, line in enumerate(data_lines):
-                try:
-                    parts = line.split(',')
-                    if len(parts) >= 4:  # Changed from 5 to 4 to handle outdoor format
-                        # Format: "DD/MM/YYYY HH:MM,sample_size,temperature,pressure[,humidity]"
-                        datetime_str = parts[0].strip()  # Already contains both date and time
-                        sample_size = int(parts[1].strip())
-                        temperature = float(parts[2].strip())
-                        pressure = float(parts[3].strip())
-                        
-                        # Handle humidity - might be missing or "N/A" for outdoor data
-                        humidity = None
-                        if len(parts) >= 5:
-                            humidity_str = parts[4].strip()
-                            if humidity_str.upper() not in ['N/A', 'NA', '']:
-                                try:
-                                    humidity = float(humidity_str)
-                                except ValueError:
-                                    humidity = None
-                        
-                        parsed_data.append({
-                            'datetime': datetime_str,
-                            'sample_size': sample_size,
-                            'temperature': temperature,
-                            'pressure': pressure,
-                            'humidity': humidity if humidity is not None else pd.NA  # Use pandas NA for missing data
-                        })
-                        
-                        if humidity is not None:
-                            self.logger.debug(f"Parsed line {i+1}: T={temperature}°C, P={pressure}hPa, H={humidity}%RH")
-                        else:
-                            self.logger.debug(f"Parsed line {i+1} (outdoor): T={temperature}°C, P={pressure}hPa, H=N/A")
-                    else:
-                        self.logger.warning(f"Line {i+1} has insufficient data ({len(parts)} parts): {line}")
-                        
-                except (ValueError, IndexError) as e:
-                    self.logger.warning(f"Error parsing line {i+1}: {line} - {e}")
-                    continue
-            
-            if not parsed_data:
-                self.logger.warning("No valid data parsed from CSV")
-                return pd.DataFrame()
-            
-            df = pd.DataFrame(parsed_data)
-            df['datetime'] = pd.to_datetime(df['datetime'], format='%d/%m/%Y %H:%M')
-            
-            self.logger.info(f"Successfully parsed {len(df)} records from CSV")
-            self.logger.debug(f"Data range: {df['datetime'].min()} to {df['datetime'].max()}")
-            
-            return df
-            
-        except Exception as e:
-            self.logger.error(f"Error parsing CSV content: {e}")
-            self.logger.debug(f"Full traceback: {traceback.format_exc()}")
-            return pd.DataFrame()
+        source = self.data_cache if kind == 'indoor' else self.outdoor_data_cache
+        frames = []
+        # Slice of the (sorted) available dates inside the range by binary search
+        first = int(np.searchsorted(self._date_keys, np.datetime64(start_dt, 'D'), side='left'))
+        last = int(np.searchsorted(self._date_keys, np.datetime64(end_dt, 'D'), side='right'))
+        for date_str in self.available_dates[first:last]:
+            # Outdoor data is only used for days that also have indoor data
+            if date_str in self.data_cache and date_str in source:
+                df = source[date_str]
+                if not df.empty:
+                    frames.append(df)
+                else:
+                    self.logger.warning(f"No valid {kind} data found for {date_str}")
+        
+        combined = pd.concat(frames, ignore_index=True) if frames else None
+        # Days are concatenated in date order, so the data is normally sorted already; otherwise
+        # a stable sort merges the sorted per-day runs instead of sorting from scratch
+        if combined is not None and not combined['datetime'].is_monotonic_increasing:
+            combined = combined.sort_values('datetime', kind='stable')
+        self._combined_cache[kind] = ((start_dt, end_dt), combined, len(frames))
+        return combined, len(frames)
     
     def generate_plot(self):
         """Generate time series plots for selected date range"""
@@ -1060,77 +1804,35 @@ class EnvironmentalDataPlotter(QMainWindow):
             self.status_bar.showMessage("Processing data and generating plots...")
             self.logger.debug("Collecting data for selected date range")
             
-            # Collect indoor data for selected range
-            indoor_data = []
-            outdoor_data = []
-            dates_to_process = []
-            
-            # Find all dates in range
-            current_dt = start_dt
-            while current_dt <= end_dt:
-                date_str = current_dt.strftime("%d/%m/%Y")
-                if date_str in self.data_cache:
-                    dates_to_process.append(date_str)
-                current_dt += timedelta(days=1)
-            
-            self.logger.debug(f"Found {len(dates_to_process)} dates with indoor data in selected range")
-            
-            # Parse indoor data for each date
-            for date_str in dates_to_process:
-                self.logger.debug(f"Processing indoor data for {date_str}")
-                content = self.data_cache[date_str]
-                df = self.parse_csv_content(content)
-                if not df.empty:
-                    indoor_data.append(df)
-                    self.logger.debug(f"Added {len(df)} indoor records from {date_str}")
-                else:
-                    self.logger.warning(f"No valid indoor data found for {date_str}")
-            
-            # Parse outdoor data for each date (if available)
-            for date_str in dates_to_process:
-                if date_str in self.outdoor_data_cache:
-                    self.logger.debug(f"Processing outdoor data for {date_str}")
-                    content = self.outdoor_data_cache[date_str]
-                    self.logger.debug(f"Outdoor content preview for {date_str}: {content[:100]}")
-                    df = self.parse_csv_content(content)
-                    if not df.empty:
-                        outdoor_data.append(df)
-                        self.logger.debug(f"Added {len(df)} outdoor records from {date_str}")
-                        self.logger.debug(f"Outdoor data sample: T={df['temperature'].iloc[0]:.1f}°C, P={df['pressure'].iloc[0]:.1f}hPa")
-                    else:
-                        self.logger.warning(f"No valid outdoor data found for {date_str}")
-                else:
-                    self.logger.debug(f"No outdoor data available for {date_str}")
+            # Combined, time-sorted data for the range (cached until the next download)
+            combined_indoor_df, indoor_files = self._get_combined(start_dt, end_dt, 'indoor')
+            combined_outdoor_df, outdoor_files = self._get_combined(start_dt, end_dt, 'outdoor')
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
             
-            self.logger.info(f"Total outdoor data files processed: {len(outdoor_data)}")
+            self.logger.info(f"Total data files processed: {indoor_files} indoor, {outdoor_files} outdoor")
             
-            if not indoor_data:
+            if combined_indoor_df is None:
                 self.logger.warning("No indoor data found in selected date range")
                 QMessageBox.warning(self, "No Data", "No indoor data available for the selected date range")
                 self.status_bar.showMessage("Ready")
                 return
             
-            # Combine indoor data
-            combined_indoor_df = pd.concat(indoor_data, ignore_index=True)
-            combined_indoor_df = combined_indoor_df.sort_values('datetime')
-            
-            # Combine outdoor data if available
-            combined_outdoor_df = None
-            if outdoor_data:
-                combined_outdoor_df = pd.concat(outdoor_data, ignore_index=True)
-                combined_outdoor_df = combined_outdoor_df.sort_values('datetime')
+            if combined_outdoor_df is not None:
                 self.logger.info(f"Combined outdoor data: {len(combined_outdoor_df)} total records")
-                self.logger.debug(f"Outdoor data time range: {combined_outdoor_df['datetime'].min()} to {combined_outdoor_df['datetime'].max()}")
-                self.logger.debug(f"Outdoor temp range: {combined_outdoor_df['temperature'].min():.1f}°C to {combined_outdoor_df['temperature'].max():.1f}°C")
-                self.logger.debug(f"Outdoor pressure range: {combined_outdoor_df['pressure'].min():.1f}hPa to {combined_outdoor_df['pressure'].max():.1f}hPa")
+                if debug_enabled:
+                    self.logger.debug(f"Outdoor data time range: {combined_outdoor_df['datetime'].min()} to {combined_outdoor_df['datetime'].max()}")
+                    self.logger.debug(f"Outdoor temp range: {combined_outdoor_df['temperature'].min():.1f}°C to {combined_outdoor_df['temperature'].max():.1f}°C")
+                    self.logger.debug(f"Outdoor pressure range: {combined_outdoor_df['pressure'].min():.1f}hPa to {combined_outdoor_df['pressure'].max():.1f}hPa")
             else:
                 self.logger.info("No outdoor data available for plotting")
             
             self.logger.info(f"Combined indoor data: {len(combined_indoor_df)} total records")
-            self.logger.debug(f"Indoor data time range: {combined_indoor_df['datetime'].min()} to {combined_indoor_df['datetime'].max()}")
+            if debug_enabled:
+                self.logger.debug(f"Indoor data time range: {combined_indoor_df['datetime'].min()} to {combined_indoor_df['datetime'].max()}")
             
             # Create plots
             self.logger.debug("Creating time series plots")
+            self.create_canvas()
             self.canvas.create_time_series_plots(combined_indoor_df, combined_outdoor_df)
             
             plot_info = f"Plot generated successfully - {len(combined_indoor_df)} indoor data points"
@@ -1178,70 +1880,49 @@ class EnvironmentalDataPlotter(QMainWindow):
             start_dt = datetime.strptime(start_date, "%d/%m/%Y")
             end_dt = datetime.strptime(end_date, "%d/%m/%Y")
             
-            # Collect and combine indoor data
-            indoor_data = []
-            outdoor_data = []
-            current_date = start_dt
-            
-            while current_date <= end_dt:
-                date_str = current_date.strftime("%d/%m/%Y")
-                if date_str in self.data_cache:
-                    df = self.parse_csv_content(self.data_cache[date_str])
-                    if not df.empty:
-                        indoor_data.append(df)
-                
-                # Check for outdoor data
-                if date_str in self.outdoor_data_cache:
-                    df_outdoor = self.parse_csv_content(self.outdoor_data_cache[date_str])
-                    if not df_outdoor.empty:
-                        outdoor_data.append(df_outdoor)
-                
-                current_date += timedelta(days=1)
+            # Combined, time-sorted data for the range (cached until the next download)
+            combined_indoor_df, indoor_files = self._get_combined(start_dt, end_dt, 'indoor')
+            combined_outdoor_df, outdoor_files = self._get_combined(start_dt, end_dt, 'outdoor')
             
-            if not indoor_data:
+            if combined_indoor_df is None:
                 QMessageBox.warning(self, "No Data", "No indoor data available for selected date range")
                 return
             
-            # Combine indoor data
-            combined_indoor_df = pd.concat(indoor_data, ignore_index=True)
-            combined_indoor_df = combined_indoor_df.sort_values('datetime')
+            # Shallow copy, the export columns below must not be added to the cached frame
+            combined_indoor_df = combined_indoor_df.copy(deep=False)
             
             # Add feels like temperature to indoor data
-            feels_like_temp = []
-            canvas = MatplotlibCanvas()  # Create temporary instance for calculation
-            for _, row in combined_indoor_df.iterrows():
-                feels_like = canvas.calculate_heat_index(row['temperature'], row['humidity'])
-                feels_like_temp.append(feels_like)
-            combined_indoor_df['feels_like'] = feels_like_temp
-            
-            # Format datetime for export
-            combined_indoor_df['Date/Time'] = combined_indoor_df['datetime'].dt.strftime('%d/%m/%Y %H:%M')
+            combined_indoor_df['feels_like'] = MatplotlibCanvas.calculate_heat_index_vec(
+                combined_indoor_df['temperature'].to_numpy(dtype=float),
+                combined_indoor_df['humidity'].to_numpy(dtype=float, na_value=np.nan)
+            )
             
             # Prepare export dataframe
-            export_columns = ['Date/Time', 'sample_size', 'temperature', 'pressure', 'humidity', 'feels_like']
+            export_columns = ['datetime', 'sample_size', 'temperature', 'pressure', 'humidity', 'feels_like']
             export_df = combined_indoor_df[export_columns].copy()
-            export_df.columns = ['Date/Time', 'Sample Size', 'Indoor Temperature (°C)', 'Indoor Pressure (hPa)', 'Humidity (%RH)', 'Feels Like (°C)']
+            export_df.columns = ['datetime', 'Sample Size', 'Indoor Temperature (°C)', 'Indoor Pressure (hPa)', 'Humidity (%RH)', 'Feels Like (°C)']
             
             # Add outdoor data if available
-            if outdoor_data:
-                combined_outdoor_df = pd.concat(outdoor_data, ignore_index=True)
-                combined_outdoor_df = combined_outdoor_df.sort_values('datetime')
-                combined_outdoor_df['Date/Time'] = combined_outdoor_df['datetime'].dt.strftime('%d/%m/%Y %H:%M')
-                
+            if combined_outdoor_df is not None:
                 # Merge outdoor temperature and pressure data
-                outdoor_export = combined_outdoor_df[['Date/Time', 'temperature', 'pressure']]
-                outdoor_export.columns = ['Date/Time', 'Outdoor Temperature (°C)', 'Outdoor Pressure (hPa)']
+                outdoor_export = combined_outdoor_df[['datetime', 'temperature', 'pressure']].copy()
+                outdoor_export.columns = ['datetime', 'Outdoor Temperature (°C)', 'Outdoor Pressure (hPa)']
                 
-                # Merge with indoor data on Date/Time
-                export_df = pd.merge(export_df, outdoor_export, on='Date/Time', how='left')
+                # Both frames are time-sorted, so match each indoor reading to the nearest
+                # outdoor one with a sorted merge; the tolerance absorbs small clock drift
+                export_df = pd.merge_asof(export_df, outdoor_export, on='datetime',
+                                          tolerance=pd.Timedelta(minutes=1), direction='nearest')
+            
+            # Format datetime for export
+            export_df.insert(0, 'Date/Time', _format_datetimes(export_df.pop('datetime')))
             
             export_df.to_csv(filename, index=False)
             
             export_info = f"Data exported successfully to {filename}"
-            if outdoor_data:
-                export_info += f" (includes {len(indoor_data)} indoor and {len(outdoor_data)} outdoor data files)"
+            if outdoor_files:
+                export_info += f" (includes {indoor_files} indoor and {outdoor_files} outdoor data files)"
             else:
-                export_info += f" (includes {len(indoor_data)} indoor data files)"
+                export_info += f" (includes {indoor_files} indoor data files)"
             
             QMessageBox.information(self, "Export Success", export_info)
             self.status_bar.showMessage(f"Data exported to {os.path.basename(filename)}")